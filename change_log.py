@@ -0,0 +1,115 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+# TABLES TRACKED BY THE CHANGE LOG AND THEIR COLUMNS
+CHANGE_LOG_TABLES = {
+    "work_orders": ["template_type", "asset_id", "description", "priority", "requested_date"],
+    "inventory": ["part_id", "name_description", "location", "quantity_on_hand", "min_level", "max_level", "last_restock_date", "supplier_info"],
+    "technicians": ["name", "technician_id", "contact_details", "certifications", "skill_sets", "experience_level", "work_location", "shift_schedule"]
+}
+
+def row_json(prefix, columns):
+    return "json_object('id', " + prefix + ".id, " + ", ".join(f"'{col}', {prefix}.{col}" for col in columns) + ")"
+
+def create_change_log(c):
+    # CHANGE LOG WITH A MONOTONICALLY INCREASING VERSION, POPULATED BY TRIGGERS
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'change_log'")
+    exists = c.fetchone() is not None
+    c.execute('''CREATE TABLE IF NOT EXISTS change_log (
+                 version INTEGER PRIMARY KEY AUTOINCREMENT,
+                 table_name TEXT NOT NULL,
+                 row_id INTEGER NOT NULL,
+                 operation TEXT NOT NULL,
+                 changed_at TEXT NOT NULL,
+                 old_data TEXT,
+                 new_data TEXT
+                 )''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_change_log_row ON change_log (table_name, row_id)")
+    for table, columns in CHANGE_LOG_TABLES.items():
+        c.execute(f'''CREATE TRIGGER IF NOT EXISTS {table}_change_log_insert AFTER INSERT ON {table}
+                      BEGIN
+                          INSERT INTO change_log (table_name, row_id, operation, changed_at, new_data)
+                          VALUES ('{table}', NEW.id, 'INSERT', datetime('now'), {row_json("NEW", columns)});
+                      END''')
+        c.execute(f'''CREATE TRIGGER IF NOT EXISTS {table}_change_log_update AFTER UPDATE ON {table}
+                      BEGIN
+                          INSERT INTO change_log (table_name, row_id, operation, changed_at, old_data, new_data)
+                          VALUES ('{table}', NEW.id, 'UPDATE', datetime('now'), {row_json("OLD", columns)}, {row_json("NEW", columns)});
+                      END''')
+        c.execute(f'''CREATE TRIGGER IF NOT EXISTS {table}_change_log_delete AFTER DELETE ON {table}
+                      BEGIN
+                          INSERT INTO change_log (table_name, row_id, operation, changed_at, old_data)
+                          VALUES ('{table}', OLD.id, 'DELETE', datetime('now'), {row_json("OLD", columns)});
+                      END''')
+        if not exists:
+            # SEED THE LOG WITH ROWS WRITTEN BEFORE IT EXISTED SO VERSION 0 IS A FULL SNAPSHOT
+            c.execute(f'''INSERT INTO change_log (table_name, row_id, operation, changed_at, new_data)
+                          SELECT '{table}', id, 'INSERT', datetime('now'), {row_json(table, columns)} FROM {table} ORDER BY id''')
+
+def current_version(conn):
+    row = conn.execute("SELECT MAX(version) FROM change_log").fetchone()
+    return row[0] or 0
+
+def has_change_log(conn):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'change_log'").fetchone() is not None
+
+def load_changes_since(conn, since_version, until_version, compact=True):
+    # ROWS CHANGED IN (since_version, until_version]; COMPACT KEEPS ONLY THE LATEST CHANGE PER ROW.
+    # READ until_version WITH current_version() FIRST SO WRITES COMMITTED IN BETWEEN ARE LEFT FOR THE NEXT EXPORT.
+    if compact:
+        query = '''SELECT version, table_name, row_id, operation, changed_at, old_data, new_data FROM change_log
+                   WHERE version IN (SELECT MAX(version) FROM change_log WHERE version > ? AND version <= ? GROUP BY table_name, row_id)
+                   ORDER BY version'''
+    else:
+        query = '''SELECT version, table_name, row_id, operation, changed_at, old_data, new_data FROM change_log
+                   WHERE version > ? AND version <= ? ORDER BY version'''
+    changes = []
+    for row in conn.execute(query, (since_version, until_version)):
+        change = {
+            "version": row[0],
+            "table": row[1],
+            "id": row[2],
+            "operation": row[3],
+            "changed_at": row[4],
+            "data": json.loads(row[6]) if row[6] is not None else None
+        }
+        if not compact:
+            change["old_data"] = json.loads(row[5]) if row[5] is not None else None
+        changes.append(change)
+    return changes
+
+def changes_to_jsonl(changes):
+    return "".join(json.dumps(change) + "\n" for change in changes)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EXPORT ROWS CHANGED SINCE A CHANGE LOG VERSION AS JSONL.")
+    parser.add_argument("--since", type=int, default=0, help="EXPORT CHANGES WITH A VERSION GREATER THAN THIS (DEFAULT: 0, FULL SNAPSHOT)")
+    parser.add_argument("--db", default="reliability_data.db", help="PATH TO THE SQLITE DATABASE")
+    parser.add_argument("--output", help="JSONL FILE TO WRITE (DEFAULT: STDOUT)")
+    parser.add_argument("--all-events", action="store_true", help="EXPORT EVERY CHANGE EVENT INSTEAD OF THE LATEST CHANGE PER ROW")
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.db):
+        parser.error(f"DATABASE NOT FOUND: {args.db}")
+    conn = sqlite3.connect(args.db)
+    if not has_change_log(conn):
+        conn.close()
+        parser.error(f"NO CHANGE LOG IN {args.db}; OPEN IT WITH THE APP ONCE TO CREATE IT")
+    until_version = current_version(conn)
+    changes = load_changes_since(conn, args.since, until_version, compact=not args.all_events)
+    conn.close()
+    # SYNC CURSOR FOR THE NEXT --since: THE HIGHEST VERSION ACTUALLY EXPORTED
+    cursor = max((change["version"] for change in changes), default=args.since)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(changes_to_jsonl(changes))
+    else:
+        sys.stdout.write(changes_to_jsonl(changes))
+    print(f"EXPORTED {len(changes)} CHANGES, NEXT --since {cursor}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
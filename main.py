@@ -1,7 +1,11 @@
 import io
+import json
+import logging
+import re
 import sqlite3
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from pprint import pprint
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -13,6 +17,11 @@ from scipy.optimize import differential_evolution
 from scipy.stats import poisson
 from docx import Document
 from docx.shared import Inches
+from change_log import changes_to_jsonl, create_change_log, current_version, load_changes_since
+
+# STRUCTURED LOGGING (REPLACES PRINT/PPRINT DIAGNOSTICS)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+logger = logging.getLogger("mission_reliability")
 
 # DISPLAY THE RANDOM LOGO AT THE TOP WITH REDUCED SIZE
 st.image("random_logo.png", width=200)
@@ -27,9 +36,41 @@ if "selected_technician" not in st.session_state:
 if "form_active" not in st.session_state:
     st.session_state.form_active = False
 
+# FULL-TEXT SEARCH INDEXES (FTS5 TABLE -> SOURCE TABLE AND INDEXED COLUMNS)
+FTS_INDEXES = {
+    "work_orders_fts": ("work_orders", ["template_type", "asset_id", "description", "priority"]),
+    "inventory_fts": ("inventory", ["part_id", "name_description", "location", "supplier_info"]),
+    "technicians_fts": ("technicians", ["name", "technician_id", "certifications", "skill_sets", "experience_level", "work_location"])
+}
+
+def create_fts_index(c, fts_table, source_table, columns):
+    # EXTERNAL-CONTENT FTS5 TABLE KEPT IN SYNC WITH ITS SOURCE TABLE BY TRIGGERS
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts_table,))
+    exists = c.fetchone() is not None
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"NEW.{col}" for col in columns)
+    old_values = ", ".join(f"OLD.{col}" for col in columns)
+    c.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5({column_list}, content='{source_table}', content_rowid='id', tokenize='porter unicode61')")
+    c.execute(f'''CREATE TRIGGER IF NOT EXISTS {fts_table}_insert AFTER INSERT ON {source_table}
+                  BEGIN
+                      INSERT INTO {fts_table} (rowid, {column_list}) VALUES (NEW.id, {new_values});
+                  END''')
+    c.execute(f'''CREATE TRIGGER IF NOT EXISTS {fts_table}_delete AFTER DELETE ON {source_table}
+                  BEGIN
+                      INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values});
+                  END''')
+    c.execute(f'''CREATE TRIGGER IF NOT EXISTS {fts_table}_update AFTER UPDATE ON {source_table}
+                  BEGIN
+                      INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values});
+                      INSERT INTO {fts_table} (rowid, {column_list}) VALUES (NEW.id, {new_values});
+                  END''')
+    if not exists:
+        # INDEX ROWS WRITTEN BEFORE THE FTS TABLE EXISTED
+        c.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")
+
 # DATABASE SETUP
 def init_db():
-    print("CONNECTING TO DATABASE ...")
+    logger.info("CONNECTING TO DATABASE ...")
     conn = sqlite3.connect("reliability_data.db")
     c = conn.cursor()
     
@@ -68,10 +109,59 @@ def init_db():
                  work_location TEXT,
                  shift_schedule TEXT
                  )''')
-    
+
+    # CREATE LOW STOCK ALERTS TABLE (MAINTAINED BY TRIGGERS ON INVENTORY)
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'low_stock_alerts'")
+    low_stock_alerts_exists = c.fetchone() is not None
+    c.execute('''CREATE TABLE IF NOT EXISTS low_stock_alerts (
+                 inventory_id INTEGER PRIMARY KEY,
+                 part_id TEXT,
+                 location TEXT,
+                 supplier_info TEXT,
+                 quantity_on_hand INTEGER,
+                 min_level INTEGER,
+                 max_level INTEGER,
+                 reorder_quantity INTEGER,
+                 updated_at TEXT
+                 )''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_low_stock_alerts_supplier ON low_stock_alerts (supplier_info)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_inventory_low_stock ON inventory (supplier_info) WHERE quantity_on_hand < min_level")
+
+    # KEEP LOW STOCK ALERTS IN SYNC WITH EVERY INVENTORY WRITE
+    c.execute('''CREATE TRIGGER IF NOT EXISTS inventory_low_stock_insert AFTER INSERT ON inventory
+                 WHEN NEW.quantity_on_hand < NEW.min_level
+                 BEGIN
+                     INSERT OR REPLACE INTO low_stock_alerts (inventory_id, part_id, location, supplier_info, quantity_on_hand, min_level, max_level, reorder_quantity, updated_at)
+                     VALUES (NEW.id, NEW.part_id, NEW.location, NEW.supplier_info, NEW.quantity_on_hand, NEW.min_level, NEW.max_level, MAX(NEW.max_level - NEW.quantity_on_hand, 0), datetime('now'));
+                 END''')
+    c.execute('''CREATE TRIGGER IF NOT EXISTS inventory_low_stock_update AFTER UPDATE ON inventory
+                 BEGIN
+                     DELETE FROM low_stock_alerts WHERE inventory_id = OLD.id;
+                     INSERT OR REPLACE INTO low_stock_alerts (inventory_id, part_id, location, supplier_info, quantity_on_hand, min_level, max_level, reorder_quantity, updated_at)
+                     SELECT NEW.id, NEW.part_id, NEW.location, NEW.supplier_info, NEW.quantity_on_hand, NEW.min_level, NEW.max_level, MAX(NEW.max_level - NEW.quantity_on_hand, 0), datetime('now')
+                     WHERE NEW.quantity_on_hand < NEW.min_level;
+                 END''')
+    c.execute('''CREATE TRIGGER IF NOT EXISTS inventory_low_stock_delete AFTER DELETE ON inventory
+                 BEGIN
+                     DELETE FROM low_stock_alerts WHERE inventory_id = OLD.id;
+                 END''')
+
+    if not low_stock_alerts_exists:
+        # BACKFILL ALERTS FOR ROWS WRITTEN BEFORE THE TRIGGERS EXISTED
+        c.execute('''INSERT OR IGNORE INTO low_stock_alerts (inventory_id, part_id, location, supplier_info, quantity_on_hand, min_level, max_level, reorder_quantity, updated_at)
+                     SELECT id, part_id, location, supplier_info, quantity_on_hand, min_level, max_level, MAX(max_level - quantity_on_hand, 0), datetime('now')
+                     FROM inventory WHERE quantity_on_hand < min_level''')
+
+    # CREATE FULL-TEXT SEARCH INDEXES FOR WORK ORDERS, INVENTORY AND TECHNICIANS
+    for fts_table, (source_table, columns) in FTS_INDEXES.items():
+        create_fts_index(c, fts_table, source_table, columns)
+
+    # CREATE CHANGE LOG FOR INCREMENTAL EXPORTS AND AUDIT TRAIL
+    create_change_log(c)
+
     conn.commit()
     conn.close()
-    print("DATABASE INITIALIZED\n")
+    logger.info("DATABASE INITIALIZED")
 
 # INITIALIZE DATABASE
 init_db()
@@ -115,6 +205,33 @@ def load_inventory():
     conn.close()
     return inventory
 
+# LOAD LOW STOCK ALERTS FROM DATABASE
+def load_low_stock_alerts():
+    conn = sqlite3.connect("reliability_data.db")
+    c = conn.cursor()
+    c.execute("SELECT inventory_id, part_id, location, supplier_info, quantity_on_hand, min_level, max_level, reorder_quantity FROM low_stock_alerts ORDER BY supplier_info, part_id")
+    alerts = []
+    for row in c.fetchall():
+        alerts.append({
+            "id": row[0],
+            "PART ID/SKU": row[1],
+            "LOCATION": row[2],
+            "SUPPLIER INFO": row[3],
+            "QUANTITY ON HAND": row[4],
+            "MIN LEVEL": row[5],
+            "MAX LEVEL": row[6],
+            "REORDER QUANTITY": row[7]
+        })
+    conn.close()
+    return alerts
+
+# GROUP REORDER QUANTITIES BY SUPPLIER
+def load_reorders_by_supplier():
+    reorders = {}
+    for alert in load_low_stock_alerts():
+        reorders.setdefault(alert["SUPPLIER INFO"], []).append(alert)
+    return reorders
+
 # LOAD TECHNICIANS FROM DATABASE
 def load_technicians():
     conn = sqlite3.connect("reliability_data.db")
@@ -136,11 +253,106 @@ def load_technicians():
     conn.close()
     return technicians
 
+# FULL-TEXT SEARCH AND TECHNICIAN MATCHING
+SEARCH_STOPWORDS = {"AND", "THE", "FOR", "WITH", "OF", "TO", "IN", "ON", "AN", "OR", "NOT", "NEAR"}
+# USER-VISIBLE KEY SHOWN FOR EACH SEARCH HIT (SOURCE TABLE -> KEY COLUMN AND LABEL)
+SEARCH_RESULT_KEYS = {
+    "work_orders": ("asset_id", "ASSET ID"),
+    "inventory": ("part_id", "PART ID/SKU"),
+    "technicians": ("technician_id", "TECHNICIAN ID")
+}
+EXPERIENCE_RANK = {"ENTRY LEVEL": 0, "INTERMEDIATE": 1, "SENIOR": 2}
+# MATCH SCORE = SKILL_OVERLAP_WEIGHT * OVERLAP + ZONE_MATCH_WEIGHT * ZONE MATCH + EXPERIENCE_WEIGHT * SENIORITY,
+# WITH OVERLAP (FRACTION OF WORK ORDER DESCRIPTION TERMS FOUND IN SKILLS/CERTIFICATIONS), ZONE MATCH AND SENIORITY ALL IN [0, 1].
+# SKILLS DOMINATE; ZONE AND EXPERIENCE ONLY SEPARATE TECHNICIANS WITH SIMILAR OVERLAP.
+SKILL_OVERLAP_WEIGHT = 0.7
+ZONE_MATCH_WEIGHT = 0.2
+# EXPERIENCE MATTERS MORE FOR HIGHER PRIORITY WORK ORDERS
+PRIORITY_EXPERIENCE_WEIGHT = {"LOW": 0.0, "MEDIUM": 0.05, "HIGH": 0.1}
+
+def fts_terms(text):
+    # SPLIT FREE TEXT INTO UNIQUE TERMS SAFE TO QUOTE IN AN FTS5 QUERY
+    # (UNICODE LETTERS AND DIGITS, LIKE THE UNICODE61 TOKENIZER; UNDERSCORE IS A SEPARATOR THERE TOO)
+    terms = []
+    for token in re.findall(r"[^\W_]+", text or ""):
+        token = token.upper()
+        if len(token) > 1 and token not in SEARCH_STOPWORDS and token not in terms:
+            terms.append(token)
+    return terms
+
+def search_saved_data(text, limit=20):
+    terms = fts_terms(text)
+    if not terms:
+        return {}
+    query = " ".join(f'"{term}"*' for term in terms)
+    conn = sqlite3.connect("reliability_data.db")
+    c = conn.cursor()
+    results = {}
+    for fts_table, (source_table, columns) in FTS_INDEXES.items():
+        key_column, key_label = SEARCH_RESULT_KEYS[source_table]
+        c.execute(f"""SELECT s.id, s.{key_column}, snippet({fts_table}, -1, '**', '**', '...', 12)
+                      FROM {fts_table} JOIN {source_table} s ON s.id = {fts_table}.rowid
+                      WHERE {fts_table} MATCH ? ORDER BY bm25({fts_table}) LIMIT ?""", (query, limit))
+        hits = [{"id": row[0], key_label: row[1], "MATCH": row[2]} for row in c.fetchall()]
+        if hits:
+            results[source_table] = hits
+    conn.close()
+    return results
+
+def rank_technicians_for_work_order(work_order_id, zone=None, limit=5):
+    conn = sqlite3.connect("reliability_data.db")
+    c = conn.cursor()
+    c.execute("SELECT description, priority FROM work_orders WHERE id = ?", (work_order_id,))
+    order = c.fetchone()
+    # SKILL TERMS COME FROM THE DESCRIPTION ONLY; TEMPLATE TYPE NAMES A CATEGORY OF WORK, NOT A SKILL
+    terms = fts_terms(order[0]) if order else []
+    if not terms:
+        conn.close()
+        return []
+    # SKILL OVERLAP: WHICH WORK ORDER TERMS EACH TECHNICIAN'S SKILLS/CERTIFICATIONS CONTAIN (PORTER-STEMMED)
+    matched_terms = {}
+    for term in terms:
+        c.execute("SELECT rowid FROM technicians_fts WHERE technicians_fts MATCH ?", (f'{{certifications skill_sets}} : "{term}"',))
+        for (rowid,) in c.fetchall():
+            matched_terms.setdefault(rowid, []).append(term)
+    if not matched_terms:
+        conn.close()
+        return []
+    placeholders = ", ".join("?" for _ in matched_terms)
+    c.execute(f"SELECT id, name, technician_id, skill_sets, certifications, experience_level, work_location FROM technicians WHERE id IN ({placeholders})",
+              list(matched_terms))
+    rows = c.fetchall()
+    conn.close()
+    experience_weight = PRIORITY_EXPERIENCE_WEIGHT.get(order[1], 0.0)
+    max_rank = max(EXPERIENCE_RANK.values())
+    matches = []
+    for row in rows:
+        overlap = len(matched_terms[row[0]]) / len(terms)
+        zone_match = zone is not None and (row[6] or "").strip().upper() == zone.strip().upper()
+        seniority = EXPERIENCE_RANK.get(row[5], 0) / max_rank
+        score = SKILL_OVERLAP_WEIGHT * overlap + ZONE_MATCH_WEIGHT * zone_match + experience_weight * seniority
+        matches.append({
+            "id": row[0],
+            "NAME": row[1],
+            "TECHNICIAN ID": row[2],
+            "SKILL SETS": row[3],
+            "CERTIFICATIONS": row[4],
+            "EXPERIENCE LEVEL": row[5],
+            "WORK LOCATION": row[6],
+            "MATCHED TERMS": ", ".join(matched_terms[row[0]]),
+            "SKILL OVERLAP": round(overlap, 3),
+            "MATCH SCORE": round(score, 3)
+        })
+    matches.sort(key=lambda match: match["MATCH SCORE"], reverse=True)
+    return matches[:limit]
+
 # FUNCTION TO GENERATE WORD DOCUMENT
 def generate_word_document():
     work_orders = load_work_orders()
     inventory = load_inventory()
     technicians = load_technicians()
+    reorders = load_reorders_by_supplier()
+    low_stock_ids = {alert["id"] for alerts in reorders.values() for alert in alerts}
     
     doc = Document()
     doc.add_heading('MISSION RELIABILITY EVALUATOR - SAVED DATA', 0)
@@ -172,12 +384,23 @@ def generate_word_document():
             doc.add_paragraph(f"MAX LEVEL: {item['MAX LEVEL']}")
             doc.add_paragraph(f"LAST RESTOCK DATE: {item['LAST RESTOCK DATE']}")
             doc.add_paragraph(f"SUPPLIER INFO: {item['SUPPLIER INFO']}")
-            if item['QUANTITY ON HAND'] < item['MIN LEVEL']:
+            if item['id'] in low_stock_ids:
                 doc.add_paragraph("WARNING: QUANTITY ON HAND IS BELOW THE MINIMUM LEVEL!", style='Intense Quote')
             doc.add_paragraph()
     else:
         doc.add_paragraph("NO INVENTORY ITEMS SAVED.")
     
+    # REORDER LIST SECTION
+    doc.add_heading('REORDER LIST', level=1)
+    if reorders:
+        for supplier, alerts in reorders.items():
+            doc.add_heading(f'SUPPLIER: {supplier}', level=2)
+            for alert in alerts:
+                doc.add_paragraph(f"{alert['PART ID/SKU']} ({alert['LOCATION']}): REORDER {alert['REORDER QUANTITY']} (ON HAND {alert['QUANTITY ON HAND']}, MIN {alert['MIN LEVEL']}, MAX {alert['MAX LEVEL']})")
+            doc.add_paragraph()
+    else:
+        doc.add_paragraph("NO ITEMS BELOW THE MINIMUM LEVEL.")
+    
     # TECHNICIANS SECTION
     doc.add_heading('TECHNICIAN PROFILES', level=1)
     if technicians:
@@ -229,13 +452,13 @@ features = {
 # WORK ORDER MANAGEMENT SECTION
 if st.button("WORK ORDER MANAGEMENT") or st.session_state.get("form_active", False):
     st.session_state.form_active = True
-    print("\n(BTN) WORK ORDER BUTTON CLICKED")
+    logger.info("(BTN) WORK ORDER BUTTON CLICKED")
     st.write("**WORK ORDER MANAGEMENT**: CREATE, TRACK, AND MANAGE WORK ORDERS EFFICIENTLY TO ENSURE TIMELY COMPLETION OF TASKS. INCLUDES EDITABLE TEMPLATES FORM FOR PREVENTIVE MAINTENANCE, REACTIVE MAINTENANCE, INSPECTIONS. FIELDS TYPICALLY INCLUDE ASSET/EQUIPMENT ID, DESCRIPTION OF ISSUE/TASK, PRIORITY LEVEL, REQUESTED DATE/TIME.")
     st.subheader("MANAGE WORK ORDERS")
 
     # FORM FOR CREATING OR EDITING WORK ORDERS
     with st.form(key="work_order_form"):
-        print("CREATING WORK ORDER FORM...")
+        logger.info("CREATING WORK ORDER FORM...")
         selected_template = st.selectbox("SELECT TEMPLATE TYPE", ["INSPECTIONS", "REACTIVE MAINTENANCE", "PREVENTIVE MAINTENANCE"], index=["INSPECTIONS", "REACTIVE MAINTENANCE", "PREVENTIVE MAINTENANCE"].index(st.session_state.selected_template), key="template_type")
         asset_id = st.text_input("ASSET/EQUIPMENT ID", value=st.session_state.get("asset_id", "EQ001"), key="asset_id_input")
         description = st.text_area("DESCRIPTION OF ISSUE/TASK", value=st.session_state.get("description", "ROUTINE CHECK-UP"), key="description_input")
@@ -244,7 +467,7 @@ if st.button("WORK ORDER MANAGEMENT") or st.session_state.get("form_active", Fal
         submit_button = st.form_submit_button(label="SAVE WORK ORDER")
 
         if submit_button:
-            print("(BTN) THE SUBMIT BUTTON WAS CLICKED")
+            logger.info("(BTN) THE SUBMIT BUTTON WAS CLICKED")
             # VALIDATE DATE
             try:
                 datetime.strptime(requested_date, "%Y-%m-%d %H:%M")
@@ -261,7 +484,7 @@ if st.button("WORK ORDER MANAGEMENT") or st.session_state.get("form_active", Fal
                 "REQUESTED DATE": requested_date
             }
             
-            pprint(work_order)
+            logger.info("SAVING WORK ORDER %s", json.dumps(work_order))
             conn = sqlite3.connect("reliability_data.db")
             c = conn.cursor()
             if "edit_index" in st.session_state:
@@ -311,13 +534,13 @@ if st.button("WORK ORDER MANAGEMENT") or st.session_state.get("form_active", Fal
 # PARTS & INVENTORY MANAGEMENT SECTION
 if st.button("PARTS & INVENTORY MANAGEMENT") or st.session_state.get("form_active", False):
     st.session_state.form_active = True
-    print("\n(BTN) PARTS & INVENTORY MANAGEMENT BUTTON CLICKED")
+    logger.info("(BTN) PARTS & INVENTORY MANAGEMENT BUTTON CLICKED")
     st.write("**PARTS & INVENTORY MANAGEMENT**: TRACK INVENTORY LEVELS, MANAGE SPARE PARTS, AND REORDER SUPPLIES TO AVOID DELAYS.")
     st.subheader("INVENTORY TRACKING")
 
     # FORM FOR ADDING OR EDITING INVENTORY ITEMS
     with st.form(key="inventory_form"):
-        print("CREATING INVENTORY FORM...")
+        logger.info("CREATING INVENTORY FORM...")
         part_id = st.text_input("PART ID/SKU", value=st.session_state.get("part_id", "PART001"), key="part_id_input")
         name_description = st.text_area("NAME AND DESCRIPTION", value=st.session_state.get("name_description", "VALVE PLUG/DISK - STANDARD SIZE"), key="name_description_input")
         location = st.text_input("LOCATION (WAREHOUSE, SITE, TRUCK, ETC.)", value=st.session_state.get("location", "WAREHOUSE A"), key="location_input")
@@ -329,7 +552,7 @@ if st.button("PARTS & INVENTORY MANAGEMENT") or st.session_state.get("form_activ
         submit_button = st.form_submit_button(label="SAVE INVENTORY ITEM")
 
         if submit_button:
-            print("(BTN) THE SUBMIT BUTTON WAS CLICKED")
+            logger.info("(BTN) THE SUBMIT BUTTON WAS CLICKED")
             # VALIDATE INPUTS
             try:
                 datetime.strptime(last_restock_date, "%Y-%m-%d")
@@ -348,7 +571,7 @@ if st.button("PARTS & INVENTORY MANAGEMENT") or st.session_state.get("form_activ
                 "LAST RESTOCK DATE": last_restock_date,
                 "SUPPLIER INFO": supplier_info
             }
-            pprint(inventory_item)
+            logger.info("SAVING INVENTORY ITEM %s", json.dumps(inventory_item))
             conn = sqlite3.connect("reliability_data.db")
             c = conn.cursor()
             if "edit_inventory_index" in st.session_state:
@@ -370,6 +593,15 @@ if st.button("PARTS & INVENTORY MANAGEMENT") or st.session_state.get("form_activ
             st.session_state["supplier_info"] = supplier_info
             st.success("INVENTORY ITEM SAVED SUCCESSFULLY!")
 
+    # LOW STOCK ALERTS AND REORDER QUANTITIES GROUPED BY SUPPLIER
+    reorders = load_reorders_by_supplier()
+    low_stock_ids = {alert["id"] for alerts in reorders.values() for alert in alerts}
+    if reorders:
+        st.subheader("LOW STOCK ALERTS")
+        for supplier, alerts in reorders.items():
+            st.warning(f"**{supplier}**: {len(alerts)} PART(S) BELOW THE MINIMUM LEVEL, {sum(alert['REORDER QUANTITY'] for alert in alerts)} UNITS TO REORDER")
+            st.dataframe(pd.DataFrame(alerts).drop(columns=["id", "SUPPLIER INFO"]))
+
     # DISPLAY AND EDIT/DELETE INVENTORY ITEMS
     inventory = load_inventory()
     if inventory:
@@ -384,7 +616,7 @@ if st.button("PARTS & INVENTORY MANAGEMENT") or st.session_state.get("form_activ
                 st.write(f"- **MAX LEVEL**: {item['MAX LEVEL']}")
                 st.write(f"- **LAST RESTOCK DATE**: {item['LAST RESTOCK DATE']}")
                 st.write(f"- **SUPPLIER INFO**: {item['SUPPLIER INFO']}")
-                if item['QUANTITY ON HAND'] < item['MIN LEVEL']:
+                if item['id'] in low_stock_ids:
                     st.warning("QUANTITY ON HAND IS BELOW THE MINIMUM LEVEL!")
                 col1, col2 = st.columns(2)
                 if col1.button("EDIT", key=f"edit_inventory_{idx}"):
@@ -409,13 +641,13 @@ if st.button("PARTS & INVENTORY MANAGEMENT") or st.session_state.get("form_activ
 # TECHNICIAN PROFILES & SKILLS TRACKING SECTION
 if st.button("TECHNICIAN PROFILES & SKILLS TRACKING") or st.session_state.get("form_active", False):
     st.session_state.form_active = True
-    print("\n(BTN) TECHNICIAN PROFILES & SKILLS TRACKING BUTTON CLICKED")
+    logger.info("(BTN) TECHNICIAN PROFILES & SKILLS TRACKING BUTTON CLICKED")
     st.write("**TECHNICIAN PROFILES & SKILLS TRACKING**: TRACK DETAILED INFO ABOUT EACH TECHNICIAN, INCLUDING SKILLS, CERTIFICATIONS, AND AVAILABILITY.")
     st.subheader("MANAGE TECHNICIANS")
 
     # FORM FOR ADDING OR EDITING TECHNICIANS
     with st.form(key="technician_form"):
-        print("CREATING TECHNICIAN FORM...")
+        logger.info("CREATING TECHNICIAN FORM...")
         name = st.text_input("NAME", value=st.session_state.get("technician_name", "AUGUSTO OLUWAFEMI JOHNSON"), key="technician_name_input")
         technician_id = st.text_input("TECHNICIAN ID", value=st.session_state.get("technician_id", "TECH001"), key="technician_id_input")
         contact_details = st.text_area("CONTACT DETAILS", value=st.session_state.get("contact_details", "PHONE: 555-1234\nEMAIL: JOHNSON.DOE@EXAMPLE.COM"), key="contact_details_input")
@@ -427,7 +659,7 @@ if st.button("TECHNICIAN PROFILES & SKILLS TRACKING") or st.session_state.get("f
         submit_button = st.form_submit_button(label="SAVE TECHNICIAN PROFILE")
 
         if submit_button:
-            print("(BTN) THE SUBMIT BUTTON WAS CLICKED")
+            logger.info("(BTN) THE SUBMIT BUTTON WAS CLICKED")
             # CREATE OR UPDATE TECHNICIAN PROFILE
             technician = {
                 "NAME": name,
@@ -439,7 +671,7 @@ if st.button("TECHNICIAN PROFILES & SKILLS TRACKING") or st.session_state.get("f
                 "WORK LOCATION": work_location,
                 "SHIFT SCHEDULE": shift_schedule
             }
-            pprint(technician)
+            logger.info("SAVING TECHNICIAN PROFILE %s", json.dumps(technician))
             conn = sqlite3.connect("reliability_data.db")
             c = conn.cursor()
             if "edit_technician_index" in st.session_state:
@@ -495,6 +727,33 @@ if st.button("TECHNICIAN PROFILES & SKILLS TRACKING") or st.session_state.get("f
                     conn.close()
                     st.experimental_rerun()
 
+    # RANK TECHNICIANS FOR A WORK ORDER BY SKILL OVERLAP, ZONE AND EXPERIENCE
+    work_orders = load_work_orders()
+    if work_orders and technicians:
+        st.subheader("FIND TECHNICIANS FOR A WORK ORDER")
+        order_options = {f"WORK ORDER {idx + 1} - {order['TEMPLATE TYPE']} ({order['ASSET ID']})": order["id"] for idx, order in enumerate(work_orders)}
+        selected_order = st.selectbox("WORK ORDER", list(order_options), key="match_work_order_input")
+        zones = sorted({tech["WORK LOCATION"] for tech in technicians if tech["WORK LOCATION"]})
+        selected_zone = st.selectbox("PREFERRED WORK LOCATION/ZONE", ["ANY"] + zones, key="match_zone_input")
+        matches = rank_technicians_for_work_order(order_options[selected_order], None if selected_zone == "ANY" else selected_zone)
+        if matches:
+            st.dataframe(pd.DataFrame(matches).drop(columns=["id"]))
+        else:
+            st.info("NO TECHNICIAN SKILLS OR CERTIFICATIONS MATCH THIS WORK ORDER.")
+
+# FULL-TEXT SEARCH ACROSS SAVED DATA
+search_text = st.text_input("SEARCH WORK ORDERS, INVENTORY AND TECHNICIANS", key="search_text_input")
+if search_text:
+    search_results = search_saved_data(search_text)
+    if search_results:
+        for table, hits in search_results.items():
+            st.write(f"**{table.replace('_', ' ').upper()}** ({len(hits)} MATCHES)")
+            key_label = SEARCH_RESULT_KEYS[table][1]
+            for hit in hits:
+                st.write(f"- {key_label} {hit[key_label]}: {hit['MATCH']}")
+    else:
+        st.info("NO SAVED DATA MATCHES THIS SEARCH.")
+
 # DOWNLOAD SAVED DATA AS WORD DOCUMENT
 if st.button("DOWNLOAD SAVED DATA AS WORD DOCUMENT"):
     st.header("DOWNLOAD ALL SAVED DATA")
@@ -511,6 +770,25 @@ if st.button("DOWNLOAD SAVED DATA AS WORD DOCUMENT"):
         mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     )
 
+# EXPORT ROWS CHANGED SINCE A GIVEN VERSION AS JSONL
+if st.button("EXPORT CHANGES SINCE VERSION") or st.session_state.get("export_changes_active", False):
+    st.session_state.export_changes_active = True
+    st.header("INCREMENTAL CHANGE EXPORT")
+    conn = sqlite3.connect("reliability_data.db")
+    version = current_version(conn)
+    st.write(f"CURRENT CHANGE LOG VERSION: {version}")
+    since_version = st.number_input("EXPORT CHANGES AFTER VERSION", min_value=0, max_value=version, value=0, step=1, format="%d", key="since_version_input")
+    all_events = st.checkbox("ALL EVENTS (AUDIT TRAIL WITH OLD DATA, INSTEAD OF THE LATEST CHANGE PER ROW)", key="all_events_input")
+    changes = load_changes_since(conn, since_version, version, compact=not all_events)
+    conn.close()
+    st.write(f"{len(changes)} {'CHANGE EVENT(S)' if all_events else 'ROW(S) CHANGED'} SINCE VERSION {since_version}.")
+    st.download_button(
+        label="DOWNLOAD CHANGES (JSONL)",
+        data=changes_to_jsonl(changes),
+        file_name=f"Reliability_{'Events' if all_events else 'Changes'}_{since_version}_{version}.jsonl",
+        mime="application/jsonl"
+    )
+
 # QR CODE GENERATION SECTION FOR ALL SAVED DATA
 if st.button("GENERATE QR CODE FOR ALL SAVED DATA"):
     st.header("QR CODE FOR ALL SAVED DATA")
@@ -578,6 +856,56 @@ with col2:
     N = st.number_input("NUMBER OF INSPECTIONS (N)", value=1, step=1, format="%d")
     S_star_90 = st.number_input("CONSTRAINT S >= 0.90 (S*)", value=0.90, step=0.01)
 
+# HOT-PATH INSTRUMENTATION
+# SHARED BY ALL SESSIONS: EACH CALCULATE RUN OVERWRITES IT (LAST WRITER WINS)
+METRICS_FILE = "calculation_metrics.json"
+metrics = {}
+active_counters = None
+
+@contextmanager
+def instrument_objective(name):
+    # COLLECT COUNTERS AND WALL/CPU TIME FOR ONE OBJECTIVE (CPU TIME OF THE CALLING SESSION THREAD ONLY)
+    global active_counters
+    active_counters = {
+        "quad_calls": 0,
+        "integrand_evaluations": 0,
+        "poisson_pmf_calls": 0,
+        "de_generations": 0,
+        "de_evaluations": 0,
+        "wall_time_s": 0.0,
+        "cpu_time_s": 0.0
+    }
+    metrics[name] = active_counters
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield active_counters
+    finally:
+        active_counters["wall_time_s"] = time.perf_counter() - wall_start
+        active_counters["cpu_time_s"] = time.thread_time() - cpu_start
+        logger.info("OBJECTIVE METRICS %s", json.dumps({"objective": name, **active_counters}))
+        active_counters = None
+
+def count(key, n=1):
+    if active_counters is not None:
+        active_counters[key] += n
+
+def counted_quad(func, a, b):
+    # WRAP SCIPY QUAD SO EVERY CALL AND INTEGRAND EVALUATION IS COUNTED
+    count("quad_calls")
+    def integrand(t):
+        count("integrand_evaluations")
+        return func(t)
+    return quad(integrand, a, b)
+
+def de_generation_callback(xk, convergence=None):
+    count("de_generations")
+
+def write_metrics_file(path=METRICS_FILE):
+    with open(path, "w") as f:
+        json.dump({"generated_at": datetime.now().isoformat(), "objectives": metrics}, f, indent=2)
+    logger.info("METRICS WRITTEN TO %s", path)
+
 # FUNCTIONS
 def theta():
     return w / (alpha * g)
@@ -595,6 +923,7 @@ def Z(m):
     return np.prod([z(i) for i in range(m + 1)])
 
 def P(t, m, lambda_val):
+    count("poisson_pmf_calls")
     return poisson.pmf(m, lambda_val * t)
 
 def u(t):
@@ -616,16 +945,16 @@ def calculate_mission_success_probability(tau, N, T, theta_val):
     if N > 0:
         R += (1 - q) ** N * sum(P(T, m, lambda_) * Z(m) for m in range(max_m))
         for i in range(1, N + 1):
-            integral, _ = quad(lambda t: (1 - V(T - t)) * u(t), 
-                              tau[i-1] + epsilon * theta_val, 
-                              tau[i] + epsilon * theta_val)
+            integral, _ = counted_quad(lambda t: (1 - V(T - t)) * u(t), 
+                                      tau[i-1] + epsilon * theta_val, 
+                                      tau[i] + epsilon * theta_val)
             R += (1 - q) ** (i-1) * p ** (N - i + 1) * integral
-        integral, _ = quad(lambda t: (1 - V(T - t)) * u(t), 
-                          tau[N] + epsilon * theta_val, T)
+        integral, _ = counted_quad(lambda t: (1 - V(T - t)) * u(t), 
+                                  tau[N] + epsilon * theta_val, T)
         R += (1 - q) ** N * integral
     else:
         R += sum(P(T, m, lambda_) * Z(m) for m in range(max_m))
-        integral, _ = quad(lambda t: (1 - V(T - t)) * u(t), 0, T)
+        integral, _ = counted_quad(lambda t: (1 - V(T - t)) * u(t), 0, T)
         R += integral
     return R
 
@@ -635,7 +964,7 @@ def calculate_failure_avoidance_probability(tau, N, T, theta_val):
     for i in range(1, N + 1):
         phi = phi_i(tau, i)
         for k in range(1, i + 1):
-            integral, _ = quad(
+            integral, _ = counted_quad(
                 lambda t: (1 - V(tau[i] + theta_val - t + delta * phi)) * u(t),
                 tau[k-1] + epsilon * theta_val, 
                 tau[k] + epsilon * theta_val)
@@ -645,7 +974,7 @@ def calculate_failure_avoidance_probability(tau, N, T, theta_val):
         term1 = sum(P(tau[i] + theta_val, k, lambda_) * 
                     sum(P(phi, l, lambda_tilde) * Z(k + l) for l in range(max_m))
                     for k in range(max_m))
-        integral, _ = quad(
+        integral, _ = counted_quad(
             lambda t: (1 - V(delta * (phi - t))) * u_tilde(t, tau[i], theta_val),
             0, phi)
         S += q * (1 - q) ** (i-1) * (term1 + integral)
@@ -668,8 +997,9 @@ def objective_2(N, lambda_val):
     theta_val = theta()
     T = total_mission_time(N)
     def objective_de(tau):
+        count("de_evaluations")
         return -calculate_failure_avoidance_probability([tau[0]], N, T, theta_val)
-    result_de = differential_evolution(objective_de, bounds=[(0, T)], maxiter=50)
+    result_de = differential_evolution(objective_de, bounds=[(0, T)], maxiter=50, callback=de_generation_callback)
     tau_de = [result_de.x[0]]
     S_de = -result_de.fun
     R_de = calculate_mission_success_probability(tau_de, N, T, theta_val)
@@ -682,11 +1012,12 @@ def objective_3(lambda_val):
     theta_val = theta()
     T = total_mission_time(N)
     def objective_de(tau):
+        count("de_evaluations")
         S = calculate_failure_avoidance_probability([tau[0]], N, T, theta_val)
         R = calculate_mission_success_probability([tau[0]], N, T, theta_val)
         penalty = 1e6 * max(0, S_star_90 - S)
         return -R + penalty
-    result_de = differential_evolution(objective_de, bounds=[(0, T)], maxiter=50)
+    result_de = differential_evolution(objective_de, bounds=[(0, T)], maxiter=50, callback=de_generation_callback)
     tau_de = [result_de.x[0]]
     R_de = calculate_mission_success_probability(tau_de, N, T, theta_val)
     S_de = calculate_failure_avoidance_probability(tau_de, N, T, theta_val)
@@ -699,11 +1030,12 @@ def objective_4(lambda_val):
     theta_val = theta()
     T = total_mission_time(N)
     def objective_de(tau):
+        count("de_evaluations")
         S = calculate_failure_avoidance_probability([tau[0]], N, T, theta_val)
         R = calculate_mission_success_probability([tau[0]], N, T, theta_val)
         penalty = 1e6 * max(0, S_star_85 - S)
         return -R + penalty
-    result_de = differential_evolution(objective_de, bounds=[(0, T)], maxiter=50)
+    result_de = differential_evolution(objective_de, bounds=[(0, T)], maxiter=50, callback=de_generation_callback)
     tau_de = [result_de.x[0]]
     R_de = calculate_mission_success_probability(tau_de, N, T, theta_val)
     S_de = calculate_failure_avoidance_probability(tau_de, N, T, theta_val)
@@ -715,13 +1047,15 @@ if st.button("CALCULATE"):
     
     # OBJECTIVE 1
     st.subheader("OBJECTIVE 1: R = S, NO INSPECTIONS")
-    R, S = objective_1(lambda_)
+    with instrument_objective("OBJECTIVE 1"):
+        R, S = objective_1(lambda_)
     st.write(f"MISSION SUCCESS PROBABILITY (R): {R:.3f}")
     st.write(f"FAILURE AVOIDANCE PROBABILITY (S): {S:.3f}")
     
     # OBJECTIVE 2
     st.subheader("OBJECTIVE 2: MAXIMIZE S")
-    R_de, S_de, tau_de = objective_2(N, lambda_)
+    with instrument_objective("OBJECTIVE 2"):
+        R_de, S_de, tau_de = objective_2(N, lambda_)
     st.write(f"MISSION SUCCESS PROBABILITY (R): {R_de:.3f}")
     st.write(f"FAILURE AVOIDANCE PROBABILITY (S): {S_de:.3f}")
     st.write(f"OPTIMAL INSPECTION TIME (TAU_1): {tau_de[0]:.3f} HR")
@@ -729,18 +1063,32 @@ if st.button("CALCULATE"):
    
     # OBJECTIVE 3
     st.subheader("OBJECTIVE 3: MAXIMIZE R S.T. S >= 0.90")
-    R_de, S_de, tau_de = objective_3(lambda_)
+    with instrument_objective("OBJECTIVE 3"):
+        R_de, S_de, tau_de = objective_3(lambda_)
     st.write(f"MISSION SUCCESS PROBABILITY (R): {R_de:.3f}")
     st.write(f"FAILURE AVOIDANCE PROBABILITY (S): {S_de:.3f}")
     st.write(f"OPTIMAL INSPECTION TIME (TAU_1): {tau_de[0]:.3f} HR")
     
     # OBJECTIVE 4
     st.subheader("OBJECTIVE 4: MAXIMIZE R S.T. S >= 0.85")
-    R_de, S_de, tau_de = objective_4(lambda_)
+    with instrument_objective("OBJECTIVE 4"):
+        R_de, S_de, tau_de = objective_4(lambda_)
     st.write(f"MISSION SUCCESS PROBABILITY (R): {R_de:.3f}")
     st.write(f"FAILURE AVOIDANCE PROBABILITY (S): {S_de:.3f}")
     st.write(f"OPTIMAL INSPECTION TIME (TAU_1): {tau_de[0]:.3f} HR")
 
+    # HOT-PATH INSTRUMENTATION PANEL
+    write_metrics_file()
+    with st.expander("HOT-PATH INSTRUMENTATION"):
+        st.write("INTEGRAND, QUAD, POISSON PMF AND DIFFERENTIAL EVOLUTION COUNTS WITH WALL/CPU TIME PER OBJECTIVE.")
+        st.dataframe(pd.DataFrame.from_dict(metrics, orient="index"))
+        st.download_button(
+            label="DOWNLOAD METRICS (JSON)",
+            data=json.dumps(metrics, indent=2),
+            file_name=METRICS_FILE,
+            mime="application/json"
+        )
+
 # ADD DATE AND TIME AND COPYRIGHT NOTICE AT THE BOTTOM
 st.write("LAST UPDATED: THURSDAY, DECEMBER 25, 2025, 06:57 AM -03")
 st.write("© 2025 ALL RIGHTS RESERVED.")